@@ -24,6 +24,8 @@ import sqlite3
 import duckdb
 from chdb import session as chs  # ← direct import, no fallback
 
+from util.file_utils import split_sql_statements
+
 # Adjust if your data root or table list changes
 root_path = "../raw_data/"
 types = ["acc", "grv", "gyr", "lit", "ped", "ppg", "hrm"]
@@ -139,8 +141,7 @@ def create(target_path: str, device_id: str, engine: str = "duckdb", post_sql: l
                     with open(sql_file, 'r', encoding='utf-8') as f:
                         sql_content = f.read()
                     # Split by semicolons and execute each statement
-                    statements = [stmt.strip() for stmt in sql_content.split(';') if stmt.strip()]
-                    for stmt in statements:
+                    for stmt in split_sql_statements(sql_content):
                         sess.query(stmt)
                     print(f"[OK] chDB executed SQL file: {sql_file}")
         finally:
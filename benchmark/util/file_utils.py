@@ -1,7 +1,20 @@
+import re
 import shutil
 from pathlib import Path
 
 
+# Matches quoted literals and comments (so that semicolons inside them are
+# skipped) as well as the statement-terminating semicolon itself.
+_SQL_TOKEN_RE = re.compile(
+    r"'(?:[^']|'')*'"      # single-quoted string literal
+    r'|"(?:[^"]|"")*"'     # double-quoted identifier
+    r"|--[^\n]*"           # line comment
+    r"|/\*.*?\*/"          # block comment
+    r"|;",
+    re.DOTALL,
+)
+
+
 def resolve_cmd(cmd: str) -> str:
     p = Path(cmd)
     if p.is_file() or ("/" in cmd or "\\" in cmd):
@@ -77,6 +90,29 @@ def project_root(start: Path | None = None) -> Path:
     )
 
 
+def split_sql_statements(sql: str) -> list[str]:
+    """
+    Split a SQL script into statements on top-level semicolons.
+
+    Semicolons inside string literals, quoted identifiers and comments do not
+    terminate a statement. The scan is a single pass of a precompiled regex.
+
+    Args:
+        sql: The SQL script content
+
+    Returns:
+        List of stripped, non-empty statements (without the trailing semicolon)
+    """
+    statements = []
+    start = 0
+    for match in _SQL_TOKEN_RE.finditer(sql):
+        if match.group() == ';':
+            statements.append(sql[start:match.start()])
+            start = match.end()
+    statements.append(sql[start:])
+    return [stmt.strip() for stmt in statements if stmt.strip()]
+
+
 def prepare_profiling_duckdb_sql_file(sql_file: Path) -> Path:
     """
     Prepare the SQL file by adding profiling configuration:
@@ -104,7 +140,7 @@ def prepare_profiling_duckdb_sql_file(sql_file: Path) -> Path:
     has_pragma = 'PRAGMA enable_profiling' in content
 
     # Split by semicolon to get individual statements
-    statements = content.split(';')
+    statements = split_sql_statements(content)
 
     new_content_parts = []
     query_number = 1
@@ -113,15 +149,9 @@ def prepare_profiling_duckdb_sql_file(sql_file: Path) -> Path:
     if not has_pragma:
         new_content_parts.append("PRAGMA enable_profiling='json'")
 
-    for i, statement in enumerate(statements):
-        statement = statement.strip()
-
-        # Skip empty statements
-        if not statement:
-            continue
-
+    for statement in statements:
         # Keep PRAGMA and existing SET statements as-is
-        if statement.startswith('PRAGMA') or statement.startswith('SET'):
+        if statement.startswith(('PRAGMA', 'SET')):
             new_content_parts.append(statement)
             continue
 
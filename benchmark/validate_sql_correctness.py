@@ -1,5 +1,13 @@
+import contextlib
+import filecmp
+import functools
+import hashlib
+import io
 import itertools
+import os
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional
 
@@ -50,6 +58,32 @@ NUMERIC_ATOL = 1e-8
 # Number of rows to sample when inferring column types
 SAMPLE_ROWS = 10
 
+# Maximum number of validation runs executed at once; each one holds its own
+# temporary copy of the database on disk while it runs
+MAX_PARALLEL_RUNS = 4
+
+# Block size used when hashing result files
+COMPARE_BLOCK_SIZE = 1 << 20
+
+
+def _file_digest(file: Path) -> bytes:
+    """Return the BLAKE2b digest of a file's contents, read in large blocks."""
+    digest = hashlib.blake2b()
+    with open(file, "rb") as f:
+        while block := f.read(COMPARE_BLOCK_SIZE):
+            digest.update(block)
+    return digest.digest()
+
+
+# Datetime layouts tried with strptime before falling back to pd.to_datetime
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d",
+)
+
 
 def try_parse_timestamp(value) -> Optional[pd.Timestamp]:
     """
@@ -64,9 +98,13 @@ def try_parse_timestamp(value) -> Optional[pd.Timestamp]:
     Returns:
         pd.Timestamp if successful, None otherwise
     """
+    return _parse_timestamp_str(str(value).strip())
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_timestamp_str(str_val: str) -> Optional[pd.Timestamp]:
+    """Cached parser behind try_parse_timestamp for an already stripped string."""
     try:
-        str_val = str(value).strip()
-        
         # Check if it's a numeric timestamp
         if str_val.isdigit():
             num_val = int(str_val)
@@ -76,53 +114,74 @@ def try_parse_timestamp(value) -> Optional[pd.Timestamp]:
             # Second timestamp (10 digits)
             elif len(str_val) == 10:
                 return pd.to_datetime(num_val, unit='s').tz_localize(None)
-        
+
+        # Fixed layouts are much cheaper than pandas' format inference
+        for fmt in _TIMESTAMP_FORMATS:
+            try:
+                return pd.Timestamp(datetime.strptime(str_val, fmt))
+            except ValueError:
+                continue
+
         # Try parsing as datetime string
         return pd.to_datetime(str_val)
     except (ValueError, TypeError, pd.errors.OutOfBoundsDatetime):
         return None
 
 
-def _parse_timestamp_series(series: pd.Series) -> pd.Series:
-    """Vectorized timestamp parsing that mimics try_parse_timestamp semantics."""
+def _utc_ns_values(parsed: pd.Series) -> np.ndarray:
+    """Return parsed UTC datetimes as naive datetime64[ns] values.
+
+    Newer pandas may return coarser units for dates such as year 1; values
+    outside the ns range become NaT instead of failing the conversion.
+    """
+    in_range = parsed.between(pd.Timestamp.min.tz_localize("UTC"), pd.Timestamp.max.tz_localize("UTC"))
+    return parsed.where(in_range).dt.tz_localize(None).dt.as_unit("ns").to_numpy()
+
+
+def _parse_timestamp_series(series: pd.Series, already_stripped: bool = False) -> pd.Series:
+    """Vectorized timestamp parsing that mimics try_parse_timestamp semantics.
+
+    Pass already_stripped=True for series that already have string dtype with
+    whitespace stripped, to skip converting and stripping them again.
+    """
     # Ensure string dtype for consistent string accessors
-    str_series = series.astype(pd.StringDtype()).str.strip()
-    result = pd.Series(pd.NaT, index=str_series.index, dtype="datetime64[ns, UTC]")
-
-    not_na = str_series.notna()
-    if not not_na.any():
-        return result
-
-    candidates = str_series[not_na]
-    digits_mask = candidates.str.fullmatch(r"\d+")
-    ms_mask = digits_mask & (candidates.str.len() == 13)
-    s_mask = digits_mask & (candidates.str.len() == 10)
-
-    if ms_mask.any():
-        ms_index = ms_mask[ms_mask].index
-        # Cast candidate strings to numeric before passing to to_datetime with a unit
-        # to avoid FutureWarning: parsing strings with 'unit' is deprecated.
-        numeric_ms = pd.to_numeric(candidates.loc[ms_index], errors="coerce")
-        result.loc[ms_index] = pd.to_datetime(
-            numeric_ms, unit="ms", errors="coerce", utc=True
-        )
-    if s_mask.any():
-        s_index = s_mask[s_mask].index
-        # Cast candidate strings to numeric before passing to to_datetime with a unit
-        numeric_s = pd.to_numeric(candidates.loc[s_index], errors="coerce")
-        result.loc[s_index] = pd.to_datetime(
-            numeric_s, unit="s", errors="coerce", utc=True
-        )
-
-    processed_mask = ms_mask | s_mask
-    remaining_candidates = candidates[~processed_mask]
-    if not remaining_candidates.empty:
-        remaining_index = remaining_candidates.index
-        result.loc[remaining_index] = pd.to_datetime(
-            remaining_candidates, errors="coerce", utc=True
-        )
-
-    return result
+    if already_stripped:
+        str_series = series
+    else:
+        str_series = series.astype(pd.StringDtype()).str.strip()
+    # Parsed values are written by position into a plain array and wrapped once
+    values = np.full(len(str_series), np.datetime64("NaT"), dtype="datetime64[ns]")
+
+    candidate_pos = np.flatnonzero(str_series.notna().to_numpy())
+    if candidate_pos.size:
+        candidates = str_series.iloc[candidate_pos]
+        # Length plus isdigit is enough to spot Unix timestamps, no regex needed
+        digits_mask = candidates.str.isdigit().to_numpy(dtype=bool)
+        lengths = candidates.str.len().to_numpy()
+        ms_mask = digits_mask & (lengths == 13)
+        s_mask = digits_mask & (lengths == 10)
+
+        if ms_mask.any():
+            # Cast candidate strings to numeric before passing to to_datetime with a unit
+            # to avoid FutureWarning: parsing strings with 'unit' is deprecated.
+            numeric_ms = pd.to_numeric(candidates[ms_mask], errors="coerce")
+            values[candidate_pos[ms_mask]] = _utc_ns_values(pd.to_datetime(
+                numeric_ms, unit="ms", errors="coerce", utc=True
+            ))
+        if s_mask.any():
+            # Cast candidate strings to numeric before passing to to_datetime with a unit
+            numeric_s = pd.to_numeric(candidates[s_mask], errors="coerce")
+            values[candidate_pos[s_mask]] = _utc_ns_values(pd.to_datetime(
+                numeric_s, unit="s", errors="coerce", utc=True
+            ))
+
+        remaining_mask = ~(ms_mask | s_mask)
+        if remaining_mask.any():
+            values[candidate_pos[remaining_mask]] = _utc_ns_values(pd.to_datetime(
+                candidates[remaining_mask], errors="coerce", utc=True
+            ))
+
+    return pd.Series(values, index=str_series.index).dt.tz_localize("UTC")
 
 
 def _infer_column_type(
@@ -135,17 +194,19 @@ def _infer_column_type(
         return "string"
 
     sample_str = sample.astype(pd.StringDtype()).str.strip()
+    numeric_candidate = pd.to_numeric(sample_str, errors="coerce")
+    is_numeric = not numeric_candidate.isna().any()
+    # Numbers with a sign, decimal point or exponent are never timestamps,
+    # so skip the much more expensive datetime parsing for them
+    if is_numeric and not sample_str.str.isdigit().all():
+        return "numeric"
 
-    # Check timestamp first (before numeric), since Unix timestamps are also numeric
+    # Timestamps take precedence over plain integers, since Unix timestamps are also numeric
     timestamp_candidate = sample_str.map(lambda v: try_parse_timestamp(v) is not None)
     if timestamp_candidate.all():
         return "timestamp"
 
-    numeric_candidate = pd.to_numeric(sample_str, errors="coerce")
-    if not numeric_candidate.isna().any():
-        return "numeric"
-
-    return "string"
+    return "numeric" if is_numeric else "string"
 
 
 def _format_diff_value(value, max_len: int = 40) -> str:
@@ -178,16 +239,23 @@ def _print_diff_summary(
     truncated_columns = False
     records = []
 
-    for row_idx in diff_row_indices[:max_diff_rows]:
-        diff_columns = np.flatnonzero(diff_mask.iloc[row_idx].to_numpy())
+    # Gather the previewed rows once as small object arrays instead of
+    # indexing a Series for every reported cell
+    shown_rows = diff_row_indices[:max_diff_rows]
+    shown_masks = diff_mask.iloc[shown_rows].to_numpy()
+    values1 = df1.iloc[shown_rows].to_numpy(dtype=object)
+    values2 = df2.iloc[shown_rows].to_numpy(dtype=object)
+    positions1 = df1.columns.get_indexer(diff_mask.columns)
+    positions2 = df2.columns.get_indexer(diff_mask.columns)
+
+    for pos, row_idx in enumerate(shown_rows):
+        diff_columns = np.flatnonzero(shown_masks[pos])
         truncated_columns |= len(diff_columns) > max_columns_per_row
         for col_pos in diff_columns[:max_columns_per_row]:
             column_name = diff_mask.columns[col_pos]
-            val1 = df1[column_name].iloc[row_idx] if column_name in df1.columns else "<missing>"
-            val2 = df2[column_name].iloc[row_idx] if column_name in df2.columns else "<missing>"
-            records.append([row_idx + 1, column_name, val1, val2,
-                ]
-            )
+            val1 = values1[pos, positions1[col_pos]] if positions1[col_pos] >= 0 else "<missing>"
+            val2 = values2[pos, positions2[col_pos]] if positions2[col_pos] >= 0 else "<missing>"
+            records.append([row_idx + 1, column_name, val1, val2])
 
     headers = ["row", "column", label1, label2]
     formatted_records = [
@@ -198,6 +266,34 @@ def _print_diff_summary(
     print(tabulate(formatted_records, headers=headers, tablefmt="github", stralign="left", numalign="left"))
 
 
+def _strip_string_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with every column cast to string dtype and whitespace stripped."""
+    return pd.DataFrame(
+        {column: df[column].astype(pd.StringDtype()).str.strip() for column in df.columns},
+        index=df.index,
+    )
+
+
+def _same_strings(series1: pd.Series, series2: pd.Series) -> np.ndarray:
+    """Elementwise string equality as a plain bool array, treating nulls as unequal."""
+    return (series1 == series2).to_numpy(dtype=bool, na_value=False)
+
+
+def _load_result_csv(file: Path) -> pd.DataFrame:
+    """Read a result CSV file with pandas, using the first row as header."""
+    return pd.read_csv(file, header=0, low_memory=False)
+
+
+def _report_identical_files() -> Tuple[bool, int]:
+    print("  ✅ Results are identical (byte-for-byte)")
+    return False, 0
+
+
+def _report_read_error(error: Exception) -> Tuple[bool, int]:
+    print(f"  ❌ Error reading CSV files: {error}")
+    return True, 1
+
+
 def compare_pair(
     file1: Path,
     label1: str,
@@ -219,14 +315,58 @@ def compare_pair(
     Returns:
         Tuple of (has_diff, diff_count)
     """
-    
+
+    # Byte-identical files cannot differ; skip parsing them entirely. filecmp
+    # stops at the first differing block, so a differing pair costs little.
     try:
-        # Read CSV files with pandas, using the first row as header
-        df1 = pd.read_csv(file1, header=0, low_memory=False)
-        df2 = pd.read_csv(file2, header=0, low_memory=False)
+        identical = filecmp.cmp(file1, file2, shallow=False)
+    except OSError as e:
+        return _report_read_error(e)
+    if identical:
+        return _report_identical_files()
+
+    return _compare_result_files(file1, label1, file2, label2, rtol=rtol, atol=atol)
+
+
+def _compare_result_files(
+    file1: Path,
+    label1: str,
+    file2: Path,
+    label2: str,
+    rtol=1e-5,
+    atol=1e-8
+) -> Tuple[bool, int]:
+    """Parse two result CSV files and compare them, reporting read errors."""
+    try:
+        df1 = _load_result_csv(file1)
+        df2 = _load_result_csv(file2)
     except Exception as e:
-        print(f"  ❌ Error reading CSV files: {e}")
-        return True, 1
+        return _report_read_error(e)
+
+    return compare_frames(df1, label1, df2, label2, rtol=rtol, atol=atol)
+
+
+def compare_frames(
+    df1: pd.DataFrame,
+    label1: str,
+    df2: pd.DataFrame,
+    label2: str,
+    rtol=1e-5,
+    atol=1e-8
+) -> Tuple[bool, int]:
+    """Compare two loaded result frames with numeric tolerance.
+
+    Args:
+        df1: First result frame
+        label1: Label for first frame
+        df2: Second result frame
+        label2: Label for second frame
+        rtol: Relative tolerance for numeric comparison (default: 1e-5)
+        atol: Absolute tolerance for numeric comparison (default: 1e-8)
+
+    Returns:
+        Tuple of (has_diff, diff_count)
+    """
 
     # Compare shapes
     if df1.shape != df2.shape:
@@ -247,19 +387,23 @@ def compare_pair(
         # Return early if headers differ
         return True, 0
 
-    one_na = df1.isna() ^ df2.isna()
-    both_na = df1.isna() & df2.isna()
+    # Compute each null mask once and derive both combinations from it
+    na1 = df1.isna().to_numpy()
+    na2 = df2.isna().to_numpy()
+    both_na = pd.DataFrame(na1 & na2, index=df1.index, columns=df1.columns)
 
-    df1_string = df1.astype(pd.StringDtype()).apply(lambda col: col.str.strip())
-    df2_string = df2.astype(pd.StringDtype()).apply(lambda col: col.str.strip())
+    df1_string = _strip_string_frame(df1)
+    df2_string = _strip_string_frame(df2)
 
     column_types = {
         column: _infer_column_type(df1[column], df2[column]) for column in df1.columns
     }
 
-    diff_mask = one_na.copy()
+    # Accumulate per-column differences in one bool array, starting from
+    # cells that are null on one side only, and wrap it as a frame once
+    diff_arr = na1 ^ na2
 
-    for column in df1.columns:
+    for col_idx, column in enumerate(df1.columns):
         col_type = column_types[column]
         column_diff = pd.Series(False, index=df1.index)
 
@@ -267,19 +411,22 @@ def compare_pair(
             series1_num = pd.to_numeric(df1[column], errors="coerce")
             series2_num = pd.to_numeric(df2[column], errors="coerce")
 
-            numeric_valid = (~series1_num.isna()) & (~series2_num.isna())
-            if numeric_valid.any():
-                close_mask = np.isclose(series1_num[numeric_valid], series2_num[numeric_valid], rtol=rtol, atol=atol)
-                column_diff.loc[numeric_valid] = ~close_mask
+            # Run isclose over the full float arrays and mask invalid rows after,
+            # rather than slicing both series down to the valid rows first
+            values1 = series1_num.to_numpy(dtype=float, na_value=np.nan)
+            values2 = series2_num.to_numpy(dtype=float, na_value=np.nan)
+            numeric_valid = ~np.isnan(values1) & ~np.isnan(values2)
+            close_mask = np.isclose(values1, values2, rtol=rtol, atol=atol)
+            column_diff = pd.Series(numeric_valid & ~close_mask, index=df1.index)
 
-            fallback_mask = (~numeric_valid) & (~both_na[column])
+            fallback_mask = (~numeric_valid) & (~both_na[column].to_numpy())
             if fallback_mask.any():
-                same_strings = (df1_string[column] == df2_string[column]).fillna(False)
-                column_diff.loc[fallback_mask] = ~same_strings.loc[fallback_mask]
+                same_strings = _same_strings(df1_string[column], df2_string[column])
+                column_diff.loc[fallback_mask] = ~same_strings[fallback_mask]
 
         elif col_type == "timestamp":
-            ts1 = _parse_timestamp_series(df1_string[column])
-            ts2 = _parse_timestamp_series(df2_string[column])
+            ts1 = _parse_timestamp_series(df1_string[column], already_stripped=True)
+            ts2 = _parse_timestamp_series(df2_string[column], already_stripped=True)
 
             timestamp_valid = ts1.notna() & ts2.notna()
             if timestamp_valid.any():
@@ -287,16 +434,17 @@ def compare_pair(
 
             fallback_mask = (~timestamp_valid) & (~both_na[column])
             if fallback_mask.any():
-                same_strings = (df1_string[column] == df2_string[column]).fillna(False)
-                column_diff.loc[fallback_mask] = ~same_strings.loc[fallback_mask]
+                same_strings = _same_strings(df1_string[column], df2_string[column])
+                column_diff.loc[fallback_mask] = ~same_strings[fallback_mask.to_numpy()]
 
         else:  # Treat as string comparison
-            same_strings = (df1_string[column] == df2_string[column]).fillna(False)
+            same_strings = _same_strings(df1_string[column], df2_string[column])
             column_diff = (~same_strings) & (~both_na[column])
 
-        diff_mask[column] = diff_mask[column] | column_diff
+        diff_arr[:, col_idx] |= np.asarray(column_diff, dtype=bool)
 
-    diff_rows = diff_mask.any(axis=1)
+    diff_mask = pd.DataFrame(diff_arr, index=df1.index, columns=df1.columns)
+    diff_rows = pd.Series(diff_arr.any(axis=1), index=df1.index)
     diff_count = int(diff_rows.sum())
     has_diff = (diff_count > 0) or header_diff
 
@@ -315,6 +463,18 @@ def compare_pair(
     return has_diff, diff_count
 
 
+def _run_captured(func, *args, **kwargs) -> Tuple[bool, str]:
+    """Run a comparison function with stdout captured.
+
+    Returns:
+        Tuple of (has_diff, report) where report is the captured stdout output
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        has_diff, _ = func(*args, **kwargs)
+    return has_diff, buffer.getvalue()
+
+
 def compare_files(result_info: List[Tuple[str, Path, str, EngineType]]) -> Tuple[int, int]:
     """Compare all files pairwise with experiment context.
 
@@ -332,30 +492,144 @@ def compare_files(result_info: List[Tuple[str, Path, str, EngineType]]) -> Tuple
     if len(result_info) < 2:
         raise ValueError("Need at least two files to compare.")
 
-    total_comparisons = 0
-    failed_comparisons = 0
-
+    pairs = []
     for (db1, f1, g1, e1), (db2, f2, g2, e2) in itertools.combinations(result_info, 2):
         if db1 != db2:
             continue  # Only compare same database
         e1_label = e1.value if hasattr(e1, "value") else str(e1)
         e2_label = e2.value if hasattr(e2, "value") else str(e2)
-        label1 = f"{g1}_{e1_label}"
-        label2 = f"{g2}_{e2_label}"
-        
-        print(f"\n🔍 for '{db1}': {label1} vs {label2}")
-        has_diff, _ = compare_pair(
-            f1, label1,
-            f2, label2,
-            rtol=NUMERIC_RTOL, atol=NUMERIC_ATOL
-        )
-        total_comparisons += 1
-        if has_diff:
-            failed_comparisons += 1
+        pairs.append((db1, f1, f"{g1}_{e1_label}", f2, f"{g2}_{e2_label}"))
+
+    total_comparisons = 0
+    failed_comparisons = 0
+    if not pairs:
+        return total_comparisons, failed_comparisons
+
+    # Hash every result file once so identical pairs are detected by digest
+    # equality instead of comparing the same files byte by byte per pair.
+    # Files that cannot be read fail every pair they are in.
+    digests = {}
+    read_errors = {}
+    for _, f1, _, f2, _ in pairs:
+        for path in (f1, f2):
+            if path in digests or path in read_errors:
+                continue
+            try:
+                digests[path] = _file_digest(path)
+            except OSError as e:
+                read_errors[path] = e
+
+    # Pairs are independent, so differing pairs are parsed and compared in
+    # worker processes; each worker returns its captured report, which is
+    # printed here in pair order. Only paths are sent to the workers.
+    max_workers = min(len(pairs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = []
+        for _, f1, label1, f2, label2 in pairs:
+            if f1 in read_errors or f2 in read_errors:
+                error = read_errors.get(f1, read_errors.get(f2))
+                outcomes.append(_run_captured(_report_read_error, error))
+            elif digests[f1] == digests[f2]:
+                outcomes.append(_run_captured(_report_identical_files))
+            else:
+                outcomes.append(executor.submit(
+                    _run_captured, _compare_result_files,
+                    f1, label1, f2, label2,
+                    rtol=NUMERIC_RTOL, atol=NUMERIC_ATOL
+                ))
+
+        for (db, _, label1, _, label2), outcome in zip(pairs, outcomes):
+            has_diff, report = outcome.result() if isinstance(outcome, Future) else outcome
+            print(f"\n🔍 for '{db}': {label1} vs {label2}")
+            sys.stdout.write(report)
+            total_comparisons += 1
+            if has_diff:
+                failed_comparisons += 1
     
     return total_comparisons, failed_comparisons
 
 
+def _abort_runs(runs) -> None:
+    """Stop the given (runner, process) runs and delete their temp DB copies.
+
+    process may be None for runners that were prepared but never launched.
+    """
+    for runner, process in runs:
+        if process is not None:
+            process.kill()
+            process.wait()
+        runner.after_run()
+
+
+def _run_validation_batch(batch) -> list:
+    """Run a batch of validation experiments concurrently.
+
+    Every temp DB copy is made (and caches dropped) before any engine in the
+    batch starts, then the engines run side by side and are collected in
+    their original order. On any failure the runs not yet collected are
+    stopped and cleaned up.
+
+    Args:
+        batch: List of (index, experiment) tuples
+
+    Returns:
+        List of (database_name, result_file, group_id, engine) tuples
+    """
+    prepared = []  # (idx, exp, runner); before_run may have copied the DB
+    running = []   # (idx, exp, runner, process)
+    try:
+        for idx, exp in batch:
+            runner = build_experiment(exp)
+            prepared.append((idx, exp, runner))
+            runner.before_run()
+        for idx, exp, runner in prepared:
+            running.append((idx, exp, runner, runner.run_subprocess()))
+    except BaseException:
+        launched = [(runner, process) for _, _, runner, process in running]
+        unlaunched = [(runner, None) for _, _, runner in prepared[len(running):]]
+        _abort_runs(launched + unlaunched)
+        raise
+
+    batch_info = []
+    for position, (idx, exp, runner, process) in enumerate(running):
+        print(f"   [{idx}] {exp.db_name} {exp.exp_name}...\n", end=" ", flush=True)
+        try:
+            process.wait()
+            # An empty stderr.log is the normal case; stat it instead of reading it
+            stderr_path = runner.results_dir / "stderr.log"
+            stderr = stderr_path.read_text() if stderr_path.stat().st_size > 0 else ""
+        except BaseException:
+            _abort_runs([(r, p) for _, _, r, p in running[position:]])
+            raise
+
+        if process.returncode != 0 or stderr:
+            # Do not leave the remaining engines running or their copies on disk
+            _abort_runs([(r, p) for _, _, r, p in running[position:]])
+            print("❌")
+            print(f"\n{'=' * 60}")
+            print(f"  ERROR: Validation failed for {exp.exp_name}")
+            print("=" * 60)
+            print(f"   Return code: {process.returncode}")
+            if stderr:
+                print(f"\n   Error output:")
+                print(f"   {stderr.strip()}")
+            print("\n" + "=" * 60)
+            print("   Validation aborted due to execution failure.")
+            print("=" * 60 + "\n")
+            sys.exit(1)
+
+        runner.after_run()
+        
+        result_file = runner.results_dir / "result.csv"
+        batch_info.append((
+            exp.db_name,
+            result_file,
+            exp.group_id,
+            exp.engine
+        ))
+    return batch_info
+
+
 def main():
     drop_caches() # will ask for sudo password
     # Parse command line arguments
@@ -367,7 +641,9 @@ def main():
     config_path = Path(__file__).parent / "config_yaml"
     config = ConfigLoader(config_path, env=args.env)
     experiments = config.filter_experiments(config.config_data.execute_pairs, False)
-    validate_pairs = [(experiment.group_id, experiment.engine) for experiment in config.config_data.validate_pairs]
+    validate_pairs = frozenset(
+        (experiment.group_id, experiment.engine) for experiment in config.config_data.validate_pairs
+    )
 
     print(f"\n📋 Configuration:")
     print(f"   • Total experiments: {len(experiments)}")
@@ -376,40 +652,13 @@ def main():
     print(f"   • Timestamp auto-conversion: enabled")
 
     print(f"\n🔧 Running validations...\n")
+    selected = [
+        (idx, exp) for idx, exp in enumerate(experiments, 1)
+        if (exp.group_id, exp.engine) in validate_pairs
+    ]
     result_info = []
-    for idx, exp in enumerate(experiments, 1):
-        if (exp.group_id, exp.engine) in validate_pairs:
-            print(f"   [{idx}] {exp.db_name} {exp.exp_name}...\n", end=" ", flush=True)
-            runner = build_experiment(exp)
-            
-            runner.before_run()
-            
-            process = runner.run_subprocess()
-            process.wait()
-            stderr = (runner.results_dir / "stderr.log").read_text()
-            if process.returncode != 0 or stderr:
-                print("❌")
-                print(f"\n{'=' * 60}")
-                print(f"  ERROR: Validation failed for {exp.exp_name}")
-                print("=" * 60)
-                print(f"   Return code: {process.returncode}")
-                if stderr:
-                    print(f"\n   Error output:")
-                    print(f"   {stderr.strip()}")
-                print("\n" + "=" * 60)
-                print("   Validation aborted due to execution failure.")
-                print("=" * 60 + "\n")
-                sys.exit(1)
-
-            runner.after_run()
-            
-            result_file = runner.results_dir / "result.csv"
-            result_info.append((
-                exp.db_name,
-                result_file,
-                exp.group_id,
-                exp.engine
-            ))
+    for start in range(0, len(selected), MAX_PARALLEL_RUNS):
+        result_info.extend(_run_validation_batch(selected[start:start + MAX_PARALLEL_RUNS]))
 
     print(f"\n{'=' * 60}")
     print("  RESULTS COMPARISON")
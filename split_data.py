@@ -1,11 +1,103 @@
 import csv
+import io
+import itertools
 import os
 import gzip
-from typing import Dict, TextIO
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Set, TextIO, Tuple
 
 
 raw_data_dir: str = "raw_data"
 
+# Rows buffered across all devices before every buffer is written out
+max_buffered_rows: int = 100_000
+
+# Userspace write buffer for each split output file
+output_buffer_size: int = 1 << 20
+
+
+def format_row(row: list) -> str:
+    """Format a row as one CSV line, exactly as csv.writer writes it."""
+    formatted = io.StringIO()
+    csv.writer(formatted).writerow(row)
+    return formatted.getvalue()
+
+
+def iter_records(f: TextIO) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (device ID, CSV line) for every non-empty record left in a CSV file.
+
+    Lines without quotes are passed through with only the line ending changed
+    to csv.writer's, since splitting them on commas gives the same fields
+    csv.reader would. From the first line with a quote on, which may start a
+    record containing commas or line breaks, the rest of the file is parsed
+    and re-written with a single csv.reader/csv.writer pair.
+    """
+    for line in f:
+        if '"' in line:
+            break
+        line = line.rstrip('\n')
+        if line:  # Skip empty rows
+            yield line.split(',', 1)[0], line + '\r\n'
+    else:
+        return
+
+    formatted = io.StringIO()
+    writer = csv.writer(formatted)
+    for row in csv.reader(itertools.chain([line], f)):
+        if not row:  # Skip empty rows
+            continue
+        writer.writerow(row)
+        yield row[0], formatted.getvalue()
+        formatted.seek(0)
+        formatted.truncate()
+
+
+def write_rows(output_file: str, header_line: str, lines: List[str], append: bool) -> None:
+    """
+    Write a batch of CSV lines to a split file, writing the header when it is created.
+
+    The file is opened only for the duration of the write, so the number of
+    open files does not grow with the number of device IDs.
+    """
+    mode: str = 'a' if append else 'w'
+    with open(output_file, mode, newline='', encoding='utf-8', buffering=output_buffer_size) as out:
+        if not append:
+            out.write(header_line)
+        out.writelines(lines)
+
+
+def write_buffers(
+    output_dir: str, filename: str, header_line: str, buffers: Dict[str, List[str]], created: Set[str]
+) -> None:
+    """Write out and clear every device's buffered lines, e.g. to acc/acc_vs14.csv."""
+    for device_id, lines in buffers.items():
+        output_file: str = os.path.join(output_dir, f"{filename}_{device_id}.csv")
+        write_rows(output_file, header_line, lines, append=device_id in created)
+        created.add(device_id)
+    buffers.clear()
+
+
+def split_name(input_file: str) -> str:
+    """Return the input file name without its .csv/.csv.gz extension."""
+    filename: str = os.path.basename(input_file)
+
+    # Handle .csv.gz files
+    if filename.endswith('.csv.gz'):
+        filename = filename[:-7]  # Remove .csv.gz
+    elif filename.endswith('.gz'):
+        filename = os.path.splitext(filename)[0]  # Remove .gz
+        filename = os.path.splitext(filename)[0]  # Remove .csv
+    else:
+        filename = os.path.splitext(filename)[0]  # Remove .csv
+    return filename
+
+
+def split_output_dir(input_file: str) -> str:
+    """Return the folder the split files of input_file are written to."""
+    return os.path.join(os.path.dirname(input_file), split_name(input_file))
+
 
 def split_file(input_file: str) -> str:
     """
@@ -20,24 +112,14 @@ def split_file(input_file: str) -> str:
     Returns:
         str: Path to the directory containing the split files
     """
-    writers: Dict[str, csv.writer] = {}
-    files: Dict[str, TextIO] = {}
+    buffers: Dict[str, List[str]] = defaultdict(list)
+    buffered_rows: int = 0
+    created: Set[str] = set()  # Device IDs whose split file already exists
 
-    # Get filename (without extension) and directory
-    base_dir: str = os.path.dirname(input_file)
-    filename: str = os.path.basename(input_file)
-    
-    # Handle .csv.gz files
-    if filename.endswith('.csv.gz'):
-        filename = filename[:-7]  # Remove .csv.gz
-    elif filename.endswith('.gz'):
-        filename = os.path.splitext(filename)[0]  # Remove .gz
-        filename = os.path.splitext(filename)[0]  # Remove .csv
-    else:
-        filename = os.path.splitext(filename)[0]  # Remove .csv
+    filename: str = split_name(input_file)
 
     # Create a folder with the same name as the original file
-    output_dir: str = os.path.join(base_dir, filename)
+    output_dir: str = split_output_dir(input_file)
     os.makedirs(output_dir, exist_ok=True)
 
     print(f"Processing {input_file}...")
@@ -53,33 +135,43 @@ def split_file(input_file: str) -> str:
         f = open(input_file, 'r', encoding='utf-8')
     
     try:
-        reader: csv.reader = csv.reader(f)
-        header: list = next(reader)
-
-        for row in reader:
-            if not row:  # Skip empty rows
-                continue
-
-            # Use the first column as device ID to split files
-            device_id: str = row[0]
-            if device_id not in writers:
-                # Create new file: e.g. acc/acc_vs14.csv
-                output_file: str = os.path.join(output_dir, f"{filename}_{device_id}.csv")
-                files[device_id] = open(output_file, 'w', newline='', encoding='utf-8')
-                writers[device_id] = csv.writer(files[device_id])
-                writers[device_id].writerow(header)
-            writers[device_id].writerow(row)
+        # Format the header once rather than for every split file
+        header_line: str = format_row(next(csv.reader(f)))
+
+        # The first column is the device ID used to split files. Rows are
+        # buffered and written in batches, but the buffers of all devices
+        # together never hold more than max_buffered_rows rows.
+        for device_id, line in iter_records(f):
+            buffers[device_id].append(line)
+            buffered_rows += 1
+            if buffered_rows >= max_buffered_rows:
+                write_buffers(output_dir, filename, header_line, buffers, created)
+                buffered_rows = 0
     finally:
         # Close the input file
         f.close()
 
-    # Close all output files
-    for file_handle in files.values():
-        file_handle.close()
+    # Write the remaining buffered rows
+    write_buffers(output_dir, filename, header_line, buffers, created)
 
     return output_dir  # Return the path to the created folder
 
 
+def split_files(input_files: List[str]) -> str:
+    """
+    Split CSV files that share an output folder, one after another.
+
+    Args:
+        input_files: Paths to the input CSV files, all mapping to the same folder
+
+    Returns:
+        str: Path to the directory containing the split files
+    """
+    for input_file in input_files:
+        output_dir: str = split_file(input_file)
+    return output_dir
+
+
 def main() -> None:
     """Main function to process all CSV files in the raw data directory."""
     # Check if raw data directory exists
@@ -87,8 +179,13 @@ def main() -> None:
         print(f"Error: Raw data directory '{raw_data_dir}' not found.")
         exit(1)
 
-    # Get list of CSV files (both .csv and .csv.gz)
-    csv_files: list[str] = [f for f in os.listdir(raw_data_dir) if f.endswith(".csv") or f.endswith(".csv.gz")]
+    # Get list of CSV files (both .csv and .csv.gz); scandir entries carry
+    # their paths and cached file type, so no extra stat/join is needed
+    with os.scandir(raw_data_dir) as entries:
+        csv_files: list[os.DirEntry] = [
+            entry for entry in entries
+            if entry.name.endswith((".csv", ".csv.gz")) and entry.is_file()
+        ]
 
     if not csv_files:
         print(f"No CSV files found in {raw_data_dir}")
@@ -96,12 +193,20 @@ def main() -> None:
 
     print(f"Found {len(csv_files)} CSV files to process")
 
-    # Process each CSV file, split by device ID
-    for file in csv_files:
-        csv_file: str = os.path.join(raw_data_dir, file)
-        print(f"\nProcessing file: {file}")
-        output_dir: str = split_file(csv_file)
-        print(f"Finished splitting {file}. Files saved to {output_dir}")
+    # Files sharing a stem (e.g. acc.csv and acc.csv.gz) write to the same
+    # folder, so they are grouped and split one after another by one worker
+    groups: Dict[str, List[os.DirEntry]] = defaultdict(list)
+    for entry in csv_files:
+        groups[split_output_dir(entry.path)].append(entry)
+
+    # Process each CSV file, split by device ID. Groups are independent, so
+    # they are split concurrently, one worker process per output folder.
+    input_groups: List[List[str]] = [[entry.path for entry in group] for group in groups.values()]
+    max_workers: int = min(len(input_groups), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for group, output_dir in zip(groups.values(), executor.map(split_files, input_groups)):
+            for entry in group:
+                print(f"Finished splitting {entry.name}. Files saved to {output_dir}")
 
     print("\nAll CSV files have been split by device ID")
 